@@ -417,13 +417,6 @@ def render_requests_table(records: List[OnePagerRecord], console: AdminConsole):
             else:
                 error_display = record.error_message
 
-        # Format sections data
-        sections_status = record.sections_status if record.sections_status else {}
-        sections_response = record.sections_response if record.sections_response else {}
-        section_sources = record.section_sources if record.section_sources else {}
-        product_images = record.product_images if record.product_images else {}
-        products = record.products if record.products else {}
-
         # Format JSON data for display
         def format_json_data(data, max_length=100):
             if not data:
@@ -457,12 +450,9 @@ def render_requests_table(records: List[OnePagerRecord], console: AdminConsole):
             "Company Logo": record.company_logo or "N/A",
             "Error Type": record.error_type or "N/A",
             "Error Message": error_display,
-            "Warnings": format_json_data(record.warnings, 50),
-            "Sections Status": format_json_data(sections_status, 50),
-            "Sections Response": format_json_data(sections_response, 50),
-            "Section Sources": format_json_data(section_sources, 50),
-            "Product Images": format_json_data(product_images, 50),
-            "Products": format_json_data(products, 50)
+            "Warnings": format_json_data(record.warnings, 50)
+            # Heavy JSON payloads (sections, sources, products) are no longer
+            # fetched for the table view; see the Request Details tab
         })
 
     df = pd.DataFrame(table_data)
@@ -522,7 +512,7 @@ def render_requests_table(records: List[OnePagerRecord], console: AdminConsole):
         if st.button("🔄 Refresh"):
             st.rerun()
 
-def render_request_details(records: List[OnePagerRecord]):
+def render_request_details(records: List[OnePagerRecord], console: AdminConsole = None):
     """Render detailed view for selected request"""
     st.subheader("🔍 Request Details")
 
@@ -537,6 +527,13 @@ def render_request_details(records: List[OnePagerRecord]):
     if selected_idx is not None:
         selected_record = records[selected_idx]
 
+        # List queries omit the heavy JSON payloads, so fetch the full
+        # record on demand for the detail view
+        if console is not None and console.db_service is not None and selected_record.id is not None:
+            full_record = asyncio.run(console.db_service.get_one_pager_record(selected_record.id))
+            if full_record:
+                selected_record = full_record
+
         col1, col2 = st.columns(2)
 
         with col1:
@@ -707,7 +704,7 @@ def main():
         render_requests_table(filtered_records, console)
 
     with tab2:
-        render_request_details(filtered_records)
+        render_request_details(filtered_records, console)
 
 if __name__ == "__main__":
     main()
@@ -1,15 +1,88 @@
 import os
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from supabase import create_client, Client
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Dict, Any, List
+from datetime import datetime, timezone
+from supabase import acreate_client, AsyncClient
+
+try:
+    # AsyncClientOptions is the async-flavored options class on newer
+    # supabase-py releases; older 2.x uses the shared ClientOptions
+    from supabase import AsyncClientOptions as _SupabaseClientOptions
+except ImportError:
+    from supabase import ClientOptions as _SupabaseClientOptions
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger("DatabaseService")
 
 
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string (utcnow is deprecated and naive)"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Short-lived read cache for point lookups (polling / status checks hit the
+# same record repeatedly). TTL is configurable via DB_CACHE_TTL_SECONDS.
+_CACHE_TTL_SECONDS = float(os.getenv("DB_CACHE_TTL_SECONDS", "5"))
+_CACHE_MAXSIZE = 2048
+
+# Shared async Supabase clients, created lazily on first use. The sync client
+# blocks the event loop on every .execute(), serializing our "async" methods.
+# Clients are cached per running event loop: the Streamlit entry points drive
+# the service through a fresh asyncio.run() per operation, and a client whose
+# keepalive connections are bound to a closed loop fails on reuse.
+_async_clients: Dict[asyncio.AbstractEventLoop, AsyncClient] = {}
+_client_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+# Request timeouts for the PostgREST/storage sub-clients. Connection pooling
+# itself is handled by the httpx keepalive pool inside the shared client
+# (and server-side by Supavisor), so timeouts are the tunable that matters.
+#
+# NOTE: postgrest-py serializes request payloads through httpx's stdlib-json
+# encoder and exposes no json_serialize hook, so orjson cannot be plugged in
+# here without monkeypatching the library. Revisit if postgrest-py grows a
+# serializer option; row *decoding* cost is already addressed by the lean
+# column selections and batch hydration below.
+_POSTGREST_TIMEOUT_SECONDS = int(os.getenv("SUPABASE_POSTGREST_TIMEOUT", "30"))
+_STORAGE_TIMEOUT_SECONDS = int(os.getenv("SUPABASE_STORAGE_TIMEOUT", "60"))
+
+
+async def _get_client(url: str, key: str) -> AsyncClient:
+    """Create (once per event loop) and reuse an async Supabase client"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        lock = _client_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            client = _async_clients.get(loop)
+            if client is None:
+                options = _SupabaseClientOptions(
+                    postgrest_client_timeout=_POSTGREST_TIMEOUT_SECONDS,
+                    storage_client_timeout=_STORAGE_TIMEOUT_SECONDS,
+                )
+                client = await acreate_client(url, key, options=options)
+                _async_clients[loop] = client
+                # Drop entries for loops that have since been closed so
+                # asyncio.run-per-call entry points do not accumulate clients
+                for stale in [l for l in _async_clients if l.is_closed()]:
+                    _async_clients.pop(stale, None)
+                    _client_locks.pop(stale, None)
+                logger.info("Async Supabase client initialized")
+    return client
+
+
 class OnePagerRecord(BaseModel):
     """Pydantic model for one-pager database records"""
+    # Keep validation cheap: ignore stray columns instead of erroring,
+    # never re-validate model instances, and skip default validation
+    model_config = ConfigDict(
+        extra='ignore',
+        revalidate_instances='never',
+        validate_default=False,
+    )
+
     id: Optional[int] = None
     request_id: str  # Unique identifier for each request
     session_id: Optional[str] = None  # Optional session identifier
@@ -46,8 +119,80 @@ class OnePagerRecord(BaseModel):
     updated_at: Optional[str] = None
 
 
+# Known model fields, computed once so per-row hydration can filter out any
+# extra columns Supabase returns without paying for full validation.
+_ONE_PAGER_FIELDS = frozenset(OnePagerRecord.model_fields.keys())
+
+# Heavy JSON payload columns excluded from list queries by default; they can
+# dominate the response size, and list views only need the summary columns.
+# Point lookups (get_one_pager_record etc.) still select everything.
+_HEAVY_FIELDS = frozenset({
+    'sections_status', 'sections_response', 'section_sources',
+    'product_images', 'products',
+})
+
+# Flat model fields that are packed into the excel_blob_info JSON column
+# rather than stored as DB columns. Extending the packed set only requires
+# adding the field name here.
+_EXCEL_BLOB_FIELDS = ('excel_blob_url', 'excel_blob_path')
+
+# Model fields that are not DB columns (packed into excel_blob_info)
+_VIRTUAL_FIELDS = frozenset(_EXCEL_BLOB_FIELDS)
+
+
+def _pack_excel_blob_info(data: dict) -> dict:
+    """Fold the flat Excel blob fields into the excel_blob_info column"""
+    values = {name: data.pop(name, None) for name in _EXCEL_BLOB_FIELDS}
+    data['excel_blob_info'] = values if any(values.values()) else None
+    return data
+
+
+def _unpack_excel_blob_info(db_record: dict) -> dict:
+    """Expand excel_blob_info back into the flat Excel blob fields"""
+    info = db_record.get('excel_blob_info')
+    if not isinstance(info, dict):
+        info = {}
+    for name in _EXCEL_BLOB_FIELDS:
+        db_record[name] = info.get(name)
+    return db_record
+
+
+_SUMMARY_COLUMNS = ','.join(
+    name for name in OnePagerRecord.model_fields
+    if name not in _HEAVY_FIELDS and name not in _VIRTUAL_FIELDS
+)
+
+# Just the columns needed to locate a record's generated artifacts
+_BLOB_COLUMNS = 'id,request_id,pptx_filename,pptx_blob_url,pptx_blob_path,metadata_blob_url,excel_blob_info'
+
+# Optional msgspec fast path: a Struct mirroring OnePagerRecord (built from
+# model_fields, so the schemas cannot drift) type-checks DB rows at C speed,
+# restoring the safety that model_construct skips at negligible cost.
+try:
+    import msgspec
+
+    def _build_row_struct():
+        fields = []
+        for name, field in OnePagerRecord.model_fields.items():
+            if field.is_required():
+                fields.append((name, field.annotation))
+            else:
+                fields.append((name, field.annotation, field.get_default()))
+        return msgspec.defstruct("_OnePagerRow", fields, kw_only=True)
+
+    _ONE_PAGER_ROW_STRUCT = _build_row_struct()
+except ImportError:
+    msgspec = None
+    _ONE_PAGER_ROW_STRUCT = None
+
+
 class DatabaseService:
-    """Service for managing one-pager records in Supabase database"""
+    """Service for managing one-pager records in Supabase database
+
+    The equality/order patterns used by the query methods below are backed
+    by the indexes in db/indexes.sql; keep the two in sync when adding
+    new filters or sort orders.
+    """
 
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
@@ -57,58 +202,131 @@ class DatabaseService:
             logger.error("Supabase credentials not found in environment variables")
             raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set")
 
+        # Client creation is async, so it is deferred to _ensure_client()
+        self.client: Optional[AsyncClient] = None
+
+        # Read caches for the point-lookup hot paths, invalidated on writes
+        self._id_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+        self._request_id_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+        self._company_recent_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+
+        logger.info("Database service initialized successfully")
+
+    def _cache_record(self, record: OnePagerRecord) -> None:
+        """Populate the read caches from a freshly fetched/written record"""
+        if record.id is not None:
+            self._id_cache[record.id] = record
+        self._request_id_cache[record.request_id] = record
+
+    def _evict_record(self, record_id: Optional[int] = None, request_id: Optional[str] = None) -> None:
+        """Drop a record from the read caches after a write"""
+        if record_id is not None:
+            old = self._id_cache.pop(record_id, None)
+            if old is not None and request_id is None:
+                request_id = old.request_id
+        if request_id is not None:
+            self._request_id_cache.pop(request_id, None)
+        # Any write can change which record is a company's most recent
+        self._company_recent_cache.clear()
+
+    async def _ensure_client(self) -> AsyncClient:
+        """Resolve the async Supabase client for the running event loop
+
+        Always goes through the per-loop cache (a dict lookup when warm):
+        pinning a client on the instance would hand back one bound to a
+        previously closed loop when callers use asyncio.run per operation.
+        """
         try:
-            self.client: Client = create_client(self.supabase_url, self.supabase_key)
-            logger.info("Database service initialized successfully")
+            self.client = await _get_client(self.supabase_url, self.supabase_key)
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {str(e)}")
             raise ValueError(f"Failed to connect to Supabase: {str(e)}")
+        return self.client
 
     def _prepare_record_for_db(self, record_data: OnePagerRecord) -> dict:
         """Prepare record data for database storage"""
-        data = record_data.model_dump(exclude={'id', 'created_at', 'updated_at'})
-        
+        # __dict__ already holds plain Python values on pydantic v2, so this
+        # avoids the full schema walk that model_dump performs
+        data = {k: v for k, v in record_data.__dict__.items()
+                if k not in ('id', 'created_at', 'updated_at')}
+
         # Store Excel blob info in a dedicated JSON field
-        excel_blob_url = data.pop('excel_blob_url', None)
-        excel_blob_path = data.pop('excel_blob_path', None)
-        
-        if excel_blob_url or excel_blob_path:
-            data['excel_blob_info'] = {
-                'excel_blob_url': excel_blob_url,
-                'excel_blob_path': excel_blob_path
-            }
-        else:
-            data['excel_blob_info'] = None
-            
-        return data
+        return _pack_excel_blob_info(data)
 
     def _extract_record_from_db(self, db_record: dict) -> OnePagerRecord:
         """Extract record from database and populate Excel blob fields"""
         # Extract Excel blob fields from excel_blob_info if they exist
-        if db_record.get('excel_blob_info') and isinstance(db_record['excel_blob_info'], dict):
-            db_record['excel_blob_url'] = db_record['excel_blob_info'].get('excel_blob_url')
-            db_record['excel_blob_path'] = db_record['excel_blob_info'].get('excel_blob_path')
+        db_record = _unpack_excel_blob_info(db_record)
+
+        row = {k: v for k, v in db_record.items() if k in _ONE_PAGER_FIELDS}
+
+        # Rows come from our own schema, so skip Pydantic validation;
+        # model_construct is an order of magnitude cheaper than __init__.
+        # When msgspec is available, type-check the row against the mirrored
+        # Struct first -- it runs in C and catches schema drift for free.
+        if msgspec is not None:
+            checked = msgspec.convert(row, _ONE_PAGER_ROW_STRUCT, strict=False)
+            row = msgspec.structs.asdict(checked)
+        return OnePagerRecord.model_construct(**row)
+
+    def _extract_records_from_db(self, rows: List[dict]) -> List[OnePagerRecord]:
+        """Hydrate a batch of DB rows into records
+
+        Hot-loop variant of _extract_record_from_db: the per-row machinery
+        (field set, constructor, unpack and msgspec converters) is bound to
+        locals once instead of being looked up for every row.
+        """
+        fields = _ONE_PAGER_FIELDS
+        construct = OnePagerRecord.model_construct
+        unpack = _unpack_excel_blob_info
+        records: List[OnePagerRecord] = []
+        append = records.append
+
+        if msgspec is not None:
+            convert = msgspec.convert
+            asdict = msgspec.structs.asdict
+            struct = _ONE_PAGER_ROW_STRUCT
+            for db_record in rows:
+                row = {k: v for k, v in unpack(db_record).items() if k in fields}
+                append(construct(**asdict(convert(row, struct, strict=False))))
         else:
-            db_record['excel_blob_url'] = None
-            db_record['excel_blob_path'] = None
-            
-        return OnePagerRecord(**db_record)
-
-    async def create_one_pager_record(self, record_data: OnePagerRecord) -> Optional[OnePagerRecord]:
-        """Create a new one-pager record in the database"""
+            for db_record in rows:
+                row = {k: v for k, v in unpack(db_record).items() if k in fields}
+                append(construct(**row))
+        return records
+
+    async def create_one_pager_record(self, record_data: OnePagerRecord, return_record: bool = True) -> Optional[OnePagerRecord]:
+        """Create a new one-pager record in the database
+
+        With return_record=False the insert uses PostgREST's
+        returning=minimal, skipping row serialization on the wire;
+        the method then returns None even on success.
+        """
         try:
             data = self._prepare_record_for_db(record_data)
-            
+
             # Add current timestamp
-            now = datetime.utcnow().isoformat()
+            now = _utcnow_iso()
             data['created_at'] = now
             data['updated_at'] = now
 
-            result = self.client.table('one_pager_reports').insert(data).execute()
+            client = await self._ensure_client()
+
+            if not return_record:
+                await client.table('one_pager_reports').insert(data, returning='minimal').execute()
+                self._evict_record(request_id=record_data.request_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Created one-pager record for request: {record_data.request_id}")
+                return None
+
+            result = await client.table('one_pager_reports').insert(data).execute()
 
             if result.data and len(result.data) > 0:
                 created_record = self._extract_record_from_db(result.data[0])
-                logger.info(f"Created one-pager record with ID: {created_record.id}")
+                self._evict_record(created_record.id, created_record.request_id)
+                self._cache_record(created_record)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Created one-pager record with ID: {created_record.id}")
                 return created_record
             else:
                 logger.error("Failed to create one-pager record: No data returned")
@@ -118,29 +336,108 @@ class DatabaseService:
             logger.error(f"Error creating one-pager record: {str(e)}")
             return None
 
-    async def update_one_pager_record(self, record_id: int, update_data: Dict[str, Any]) -> Optional[OnePagerRecord]:
-        """Update an existing one-pager record"""
+    def _prepare_batch_for_db(self, records: List[OnePagerRecord]) -> List[dict]:
+        """Prepare a batch of records for insertion, stamped with one timestamp"""
+        now = _utcnow_iso()
+        payload = []
+        for record in records:
+            data = self._prepare_record_for_db(record)
+            data['created_at'] = now
+            data['updated_at'] = now
+            payload.append(data)
+        return payload
+
+    async def create_one_pager_records(self, records: List[OnePagerRecord], return_records: bool = False) -> List[OnePagerRecord]:
+        """Insert many one-pager records in a single request
+
+        One round-trip regardless of batch size; with the default
+        return_records=False the insert uses returning=minimal and an
+        empty list is returned even on success.
+        """
+        if not records:
+            return []
         try:
-            # Handle Excel blob fields
-            excel_blob_url = update_data.pop('excel_blob_url', None)
-            excel_blob_path = update_data.pop('excel_blob_path', None)
-            
-            if excel_blob_url or excel_blob_path:
-                update_data['excel_blob_info'] = {
-                    'excel_blob_url': excel_blob_url,
-                    'excel_blob_path': excel_blob_path
-                }
-            else:
-                update_data['excel_blob_info'] = None
+            payload = self._prepare_batch_for_db(records)
+            client = await self._ensure_client()
+
+            if not return_records:
+                await client.table('one_pager_reports').insert(payload, returning='minimal').execute()
+                for record in records:
+                    self._evict_record(request_id=record.request_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Batch-inserted {len(records)} one-pager records")
+                return []
+
+            result = await client.table('one_pager_reports').insert(payload).execute()
+            created = self._extract_records_from_db(result.data or [])
+            for record in created:
+                self._evict_record(record.id, record.request_id)
+                self._cache_record(record)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Batch-inserted {len(created)} one-pager records")
+            return created
+
+        except Exception as e:
+            logger.error(f"Error batch-inserting {len(records)} one-pager records: {str(e)}")
+            return []
+
+    async def upsert_one_pager_records(self, records: List[OnePagerRecord], on_conflict: str = 'request_id') -> bool:
+        """Insert-or-update many one-pager records keyed on a unique column
+
+        Conflicting rows are overwritten with the supplied payload
+        (including created_at), so this is meant for backfills and
+        re-imports rather than incremental status updates.
+        """
+        if not records:
+            return True
+        try:
+            payload = self._prepare_batch_for_db(records)
+            client = await self._ensure_client()
+            await client.table('one_pager_reports').upsert(
+                payload, on_conflict=on_conflict, returning='minimal'
+            ).execute()
+            for record in records:
+                self._evict_record(record.id, record.request_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Batch-upserted {len(records)} one-pager records")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error batch-upserting {len(records)} one-pager records: {str(e)}")
+            return False
+
+    async def update_one_pager_record(self, record_id: int, update_data: Dict[str, Any], return_record: bool = True) -> Optional[OnePagerRecord]:
+        """Update an existing one-pager record
+
+        With return_record=False the update uses PostgREST's
+        returning=minimal, skipping row serialization on the wire;
+        the method then returns None even on success.
+        """
+        try:
+            # Handle Excel blob fields; work on a copy so the caller's
+            # dict is not mutated by the pop/updated_at bookkeeping
+            update_data = _pack_excel_blob_info(dict(update_data))
 
             # Add updated timestamp
-            update_data['updated_at'] = datetime.utcnow().isoformat()
+            update_data['updated_at'] = _utcnow_iso()
+
+            client = await self._ensure_client()
+
+            if not return_record:
+                await client.table('one_pager_reports').update(update_data, returning='minimal').eq('id', record_id).execute()
+                self._evict_record(record_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Updated one-pager record with ID: {record_id}")
+                return None
 
-            result = self.client.table('one_pager_reports').update(update_data).eq('id', record_id).execute()
+            result = await client.table('one_pager_reports').update(update_data).eq('id', record_id).execute()
 
             if result.data and len(result.data) > 0:
                 updated_record = self._extract_record_from_db(result.data[0])
-                logger.info(f"Updated one-pager record with ID: {record_id}")
+                self._evict_record(record_id, updated_record.request_id)
+                self._cache_record(updated_record)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Updated one-pager record with ID: {record_id}")
                 return updated_record
             else:
                 logger.error(f"Failed to update one-pager record with ID: {record_id}")
@@ -151,9 +448,42 @@ class DatabaseService:
             return None
 
     async def get_one_pager_record(self, record_id: int) -> Optional[OnePagerRecord]:
-        """Get a one-pager record by ID"""
+        """Get a one-pager record by ID (cached for a few seconds)"""
+        cached = self._id_cache.get(record_id)
+        if cached is not None:
+            return cached
+
+        record = await self._fetch_one_pager_record(record_id)
+        if record is not None:
+            self._cache_record(record)
+        return record
+
+    async def get_one_pager_blob_info(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """Get just the blob URLs/paths for a record as a plain dict
+
+        Selects only the artifact columns and skips model hydration
+        entirely; use this over get_one_pager_record when the caller
+        only needs download links.
+        """
+        try:
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').select(_BLOB_COLUMNS).eq('id', record_id).execute()
+
+            if result.data and len(result.data) > 0:
+                return _unpack_excel_blob_info(result.data[0])
+            else:
+                logger.warning(f"One-pager record with ID {record_id} not found")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error getting blob info for record {record_id}: {str(e)}")
+            return None
+
+    async def _fetch_one_pager_record(self, record_id: int) -> Optional[OnePagerRecord]:
+        """Fetch a one-pager record by ID from the database"""
         try:
-            result = self.client.table('one_pager_reports').select('*').eq('id', record_id).execute()
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').select('*').eq('id', record_id).execute()
 
             if result.data and len(result.data) > 0:
                 return self._extract_record_from_db(result.data[0])
@@ -165,36 +495,119 @@ class DatabaseService:
             logger.error(f"Error getting one-pager record {record_id}: {str(e)}")
             return None
 
-    async def get_one_pager_records_by_company(self, company_name: str) -> List[OnePagerRecord]:
-        """Get all one-pager records for a specific company"""
-        try:
-            result = self.client.table('one_pager_reports').select('*').eq('company_name', company_name).order('created_at', desc=True).execute()
+    async def get_one_pager_records_by_company(self, company_name: str, include_payloads: bool = False, limit: Optional[int] = None) -> List[OnePagerRecord]:
+        """Get one-pager records for a specific company, newest first
 
-            records = [self._extract_record_from_db(record) for record in result.data]
-            logger.info(f"Found {len(records)} records for company: {company_name}")
+        Heavy JSON payload fields are omitted unless include_payloads=True;
+        use get_one_pager_record to load a single full record on demand.
+        """
+        try:
+            columns = '*' if include_payloads else _SUMMARY_COLUMNS
+            client = await self._ensure_client()
+            query = client.table('one_pager_reports').select(columns).eq('company_name', company_name).order('created_at', desc=True)
+            if limit is not None:
+                query = query.limit(limit)
+            result = await query.execute()
+
+            records = self._extract_records_from_db(result.data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Found {len(records)} records for company: {company_name}")
             return records
 
         except Exception as e:
             logger.error(f"Error getting records for company {company_name}: {str(e)}")
             return []
 
-    async def get_recent_one_pager_records(self, limit: int = 100) -> List[OnePagerRecord]:
-        """Get recent one-pager records"""
+    async def get_recent_one_pager_records(self, limit: int = 100, include_payloads: bool = False) -> List[OnePagerRecord]:
+        """Get recent one-pager records
+
+        Heavy JSON payload fields are omitted unless include_payloads=True;
+        use get_one_pager_record to load a single full record on demand.
+        """
         try:
-            result = self.client.table('one_pager_reports').select('*').order('created_at', desc=True).limit(limit).execute()
+            columns = '*' if include_payloads else _SUMMARY_COLUMNS
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').select(columns).order('created_at', desc=True).limit(limit).execute()
 
-            records = [self._extract_record_from_db(record) for record in result.data]
-            logger.info(f"Retrieved {len(records)} recent records")
+            records = self._extract_records_from_db(result.data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Retrieved {len(records)} recent records")
             return records
 
         except Exception as e:
             logger.error(f"Error getting recent records: {str(e)}")
             return []
 
+    async def _iter_records(self, query_builder, limit: Optional[int], page_size: int) -> AsyncIterator[OnePagerRecord]:
+        """Page through a query with range() and yield hydrated records
+
+        query_builder is a zero-arg callable returning a fresh filtered/
+        ordered query; records are yielded page by page so callers never
+        hold more than page_size rows in memory.
+        """
+        yielded = 0
+        offset = 0
+        while True:
+            page = page_size if limit is None else min(page_size, limit - yielded)
+            if page <= 0:
+                return
+            try:
+                result = await query_builder().range(offset, offset + page - 1).execute()
+            except Exception as e:
+                logger.error(f"Error streaming one-pager records at offset {offset}: {str(e)}")
+                return
+
+            rows = result.data or []
+            for record in self._extract_records_from_db(rows):
+                yield record
+                yielded += 1
+            if len(rows) < page:
+                return
+            offset += len(rows)
+
+    async def iter_recent_one_pager_records(self, limit: Optional[int] = None, page_size: int = 200, include_payloads: bool = False) -> AsyncIterator[OnePagerRecord]:
+        """Stream recent one-pager records newest first, page by page
+
+        Async-generator counterpart to get_recent_one_pager_records for
+        large result sets (exports, scans) that should not be
+        materialized as one list.
+        """
+        columns = '*' if include_payloads else _SUMMARY_COLUMNS
+        client = await self._ensure_client()
+
+        def query():
+            return client.table('one_pager_reports').select(columns).order('created_at', desc=True)
+
+        async for record in self._iter_records(query, limit, page_size):
+            yield record
+
+    async def iter_one_pager_records_by_company(self, company_name: str, limit: Optional[int] = None, page_size: int = 200, include_payloads: bool = False) -> AsyncIterator[OnePagerRecord]:
+        """Stream a company's one-pager records newest first, page by page"""
+        columns = '*' if include_payloads else _SUMMARY_COLUMNS
+        client = await self._ensure_client()
+
+        def query():
+            return client.table('one_pager_reports').select(columns).eq('company_name', company_name).order('created_at', desc=True)
+
+        async for record in self._iter_records(query, limit, page_size):
+            yield record
+
     async def get_one_pager_record_by_request_id(self, request_id: str) -> Optional[OnePagerRecord]:
-        """Get a one-pager record by request ID"""
+        """Get a one-pager record by request ID (cached for a few seconds)"""
+        cached = self._request_id_cache.get(request_id)
+        if cached is not None:
+            return cached
+
+        record = await self._fetch_one_pager_record_by_request_id(request_id)
+        if record is not None:
+            self._cache_record(record)
+        return record
+
+    async def _fetch_one_pager_record_by_request_id(self, request_id: str) -> Optional[OnePagerRecord]:
+        """Fetch a one-pager record by request ID from the database"""
         try:
-            result = self.client.table('one_pager_reports').select('*').eq('request_id', request_id).execute()
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').select('*').eq('request_id', request_id).execute()
 
             if result.data and len(result.data) > 0:
                 return self._extract_record_from_db(result.data[0])
@@ -206,13 +619,20 @@ class DatabaseService:
             logger.error(f"Error getting one-pager record by request_id {request_id}: {str(e)}")
             return None
 
-    async def get_in_progress_records_by_company(self, company_name: str) -> List[OnePagerRecord]:
-        """Get all in-progress one-pager records for a specific company"""
+    async def get_in_progress_records_by_company(self, company_name: str, include_payloads: bool = False) -> List[OnePagerRecord]:
+        """Get all in-progress one-pager records for a specific company
+
+        Heavy JSON payload fields are omitted unless include_payloads=True;
+        use get_one_pager_record to load a single full record on demand.
+        """
         try:
-            result = self.client.table('one_pager_reports').select('*').eq('company_name', company_name).eq('status', 'in-progress').order('created_at', desc=True).execute()
+            columns = '*' if include_payloads else _SUMMARY_COLUMNS
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').select(columns).eq('company_name', company_name).eq('status', 'in-progress').order('created_at', desc=True).execute()
 
-            records = [self._extract_record_from_db(record) for record in result.data]
-            logger.info(f"Found {len(records)} in-progress records for company: {company_name}")
+            records = self._extract_records_from_db(result.data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Found {len(records)} in-progress records for company: {company_name}")
             return records
 
         except Exception as e:
@@ -220,52 +640,58 @@ class DatabaseService:
             return []
 
     async def get_recent_request_by_company(self, company_name: str) -> Optional[OnePagerRecord]:
-        """Get the most recent one-pager record for a specific company"""
-        try:
-            result = self.client.table('one_pager_reports').select('*').eq('company_name', company_name).order('created_at', desc=True).limit(1).execute()
-
-            if result.data and len(result.data) > 0:
-                record = self._extract_record_from_db(result.data[0])
+        """Get the most recent one-pager record for a specific company (cached)"""
+        cached = self._company_recent_cache.get(company_name)
+        if cached is not None:
+            return cached
+
+        record = await self._fetch_recent_request_by_company(company_name)
+        if record is not None:
+            self._company_recent_cache[company_name] = record
+            self._cache_record(record)
+        return record
+
+    async def _fetch_recent_request_by_company(self, company_name: str) -> Optional[OnePagerRecord]:
+        """Fetch the most recent one-pager record for a company from the database"""
+        records = await self.get_one_pager_records_by_company(
+            company_name, include_payloads=True, limit=1
+        )
+        if records:
+            record = records[0]
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(f"Found recent request for {company_name}: {record.request_id} (status: {record.status})")
-                return record
-            else:
-                logger.info(f"No recent request found for company: {company_name}")
-                return None
+            return record
 
-        except Exception as e:
-            logger.error(f"Error getting recent request for company {company_name}: {str(e)}")
-            return None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"No recent request found for company: {company_name}")
+        return None
 
     async def update_one_pager_record_atomic(self, record_id: int, update_data: Dict[str, Any], expected_status: Optional[str] = None) -> Optional[OnePagerRecord]:
         """Atomically update a one-pager record with optional status check"""
         try:
-            # Handle Excel blob fields
-            excel_blob_url = update_data.pop('excel_blob_url', None)
-            excel_blob_path = update_data.pop('excel_blob_path', None)
-            
-            if excel_blob_url or excel_blob_path:
-                update_data['excel_blob_info'] = {
-                    'excel_blob_url': excel_blob_url,
-                    'excel_blob_path': excel_blob_path
-                }
-            else:
-                update_data['excel_blob_info'] = None
+            # Handle Excel blob fields; work on a copy so the caller's
+            # dict is not mutated by the pop/updated_at bookkeeping
+            update_data = _pack_excel_blob_info(dict(update_data))
 
             # Add updated timestamp
-            update_data['updated_at'] = datetime.utcnow().isoformat()
+            update_data['updated_at'] = _utcnow_iso()
 
             # Build the query
-            query = self.client.table('one_pager_reports').update(update_data).eq('id', record_id)
+            client = await self._ensure_client()
+            query = client.table('one_pager_reports').update(update_data).eq('id', record_id)
             
             # Add status check if provided
             if expected_status is not None:
                 query = query.eq('status', expected_status)
 
-            result = query.execute()
+            result = await query.execute()
 
             if result.data and len(result.data) > 0:
                 updated_record = self._extract_record_from_db(result.data[0])
-                logger.info(f"Atomically updated one-pager record with ID: {record_id}")
+                self._evict_record(record_id, updated_record.request_id)
+                self._cache_record(updated_record)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Atomically updated one-pager record with ID: {record_id}")
                 return updated_record
             else:
                 if expected_status:
@@ -281,10 +707,13 @@ class DatabaseService:
     async def delete_one_pager_record(self, record_id: int) -> bool:
         """Delete a one-pager record"""
         try:
-            result = self.client.table('one_pager_reports').delete().eq('id', record_id).execute()
-            
+            client = await self._ensure_client()
+            result = await client.table('one_pager_reports').delete().eq('id', record_id).execute()
+            self._evict_record(record_id)
+
             if result.data:
-                logger.info(f"Deleted one-pager record with ID: {record_id}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Deleted one-pager record with ID: {record_id}")
                 return True
             else:
                 logger.warning(f"One-pager record with ID {record_id} not found for deletion")
@@ -293,3 +722,13 @@ class DatabaseService:
         except Exception as e:
             logger.error(f"Error deleting one-pager record {record_id}: {str(e)}")
             return False
+
+
+@lru_cache(maxsize=1)
+def get_database_service() -> DatabaseService:
+    """Return a shared DatabaseService instance.
+
+    Constructing DatabaseService per request rebuilds HTTP session state;
+    use this factory (e.g. as a dependency) so every caller reuses one.
+    """
+    return DatabaseService()
@@ -2,7 +2,7 @@ import uuid
 import time
 import logging
 from typing import Optional, Dict, Any, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 from .database_service import DatabaseService, OnePagerRecord
 
 logger = logging.getLogger("RequestManager")
@@ -99,7 +99,7 @@ class RequestManager:
                 company_name=company_name,
                 website_url=website_url,
                 status="in-progress",
-                generated_at=datetime.utcnow().isoformat(),
+                generated_at=datetime.now(timezone.utc).isoformat(),
                 duration_ms=0,
                 folder_title=folder_title,
                 base_path=base_path,
@@ -139,10 +139,8 @@ class RequestManager:
                 logger.error(f"Request not found: {request_id}")
                 return None
 
-            # Prepare update data
-            if update_data is None:
-                update_data = {}
-
+            # Prepare update data; copy so the caller's dict is untouched
+            update_data = dict(update_data) if update_data else {}
             update_data['status'] = status
 
             # Use atomic update if requested
@@ -200,10 +198,12 @@ class RequestManager:
         """Clean up stale in-progress requests that are older than specified hours"""
         try:
             from datetime import timedelta
-            cutoff_time = (datetime.utcnow() - timedelta(hours=stale_hours)).isoformat()
+            now = datetime.now(timezone.utc)
+            cutoff_time = (now - timedelta(hours=stale_hours)).isoformat()
 
             # Get stale in-progress records
-            result = self.db_service.client.table('one_pager_reports').select('id,request_id').eq('status', 'in-progress').lt('created_at', cutoff_time).execute()
+            client = await self.db_service._ensure_client()
+            result = await client.table('one_pager_reports').select('id,request_id').eq('status', 'in-progress').lt('created_at', cutoff_time).execute()
 
             if not result.data:
                 return 0
@@ -214,10 +214,10 @@ class RequestManager:
                 'status': 'error',
                 'error_type': 'timeout',
                 'error_message': f'Request timed out after {stale_hours} hours',
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': now.isoformat()
             }
 
-            result = self.db_service.client.table('one_pager_reports').update(update_data).in_('id', stale_ids).execute()
+            result = await client.table('one_pager_reports').update(update_data).in_('id', stale_ids).execute()
 
             cleaned_count = len(result.data) if result.data else 0
             logger.info(f"Cleaned up {cleaned_count} stale requests")
@@ -86,7 +86,7 @@ class AdminConsole:
     def get_recent_records(self, limit: int = 100) -> List[OnePagerRecord]:
         """Get recent records from database"""
         try:
-            records = asyncio.run(self.db_service.get_recent_one_pager_records(limit))
+            records = asyncio.run(self.db_service.get_recent_one_pager_records(limit, include_payloads=True))
             return records or []
         except Exception as e:
             print(f"Database error: {str(e)}")
@@ -97,7 +97,7 @@ class AdminConsole:
     def get_records_by_company(self, company_name: str) -> List[OnePagerRecord]:
         """Get records for specific company"""
         try:
-            return asyncio.run(self.db_service.get_one_pager_records_by_company(company_name))
+            return asyncio.run(self.db_service.get_one_pager_records_by_company(company_name, include_payloads=True))
         except Exception as e:
             st.error(f"Error fetching company records: {str(e)}")
             return []
@@ -105,7 +105,7 @@ class AdminConsole:
     def get_records_by_status(self, status: str) -> List[OnePagerRecord]:
         """Get records by status"""
         try:
-            records = asyncio.run(self.db_service.get_recent_one_pager_records(1000))
+            records = asyncio.run(self.db_service.get_recent_one_pager_records(1000, include_payloads=True))
             return [r for r in records if r.status == status]
         except Exception as e:
             st.error(f"Error fetching records by status: {str(e)}")
@@ -0,0 +1,29 @@
+-- Indexes for one_pager_reports, matching the query patterns in
+-- app/services/database_service.py.
+--
+-- Apply with psql (or migration tooling) against the project's
+-- connection string: CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block, and the Supabase SQL editor wraps statements in
+-- one. If you must use the SQL editor, remove the CONCURRENTLY keyword
+-- below -- creation then takes a write lock on the table for the
+-- duration, which is acceptable for this table's size today.
+
+-- get_one_pager_record_by_request_id: eq('request_id', ...)
+-- request_id is the logical key for a run, so enforce uniqueness too.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS one_pager_reports_request_id_key
+    ON one_pager_reports (request_id);
+
+-- get_one_pager_records_by_company / get_recent_request_by_company:
+-- eq('company_name', ...) ordered by created_at DESC (with/without limit)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS one_pager_reports_company_created_idx
+    ON one_pager_reports (company_name, created_at DESC);
+
+-- get_recent_one_pager_records: order by created_at DESC with limit
+CREATE INDEX CONCURRENTLY IF NOT EXISTS one_pager_reports_created_idx
+    ON one_pager_reports (created_at DESC);
+
+-- get_in_progress_records_by_company and cleanup_stale_requests only ever
+-- look at status = 'in-progress', so a partial index stays tiny.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS one_pager_reports_in_progress_idx
+    ON one_pager_reports (company_name, created_at DESC)
+    WHERE status = 'in-progress';
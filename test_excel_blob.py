@@ -78,9 +78,22 @@ async def test_excel_blob_save():
                 print(f"   - Excel Blob URL: {retrieved_record.excel_blob_url}")
                 print(f"   - Excel Blob Path: {retrieved_record.excel_blob_path}")
                 
+                # Also verify via the model-free blob info lookup
+                print("\n🔍 Fetching blob info via get_one_pager_blob_info...")
+                blob_info = await db_service.get_one_pager_blob_info(saved_record.id)
+                if blob_info:
+                    print("✅ Blob info retrieved successfully!")
+                    print(f"   - Excel Blob URL: {blob_info.get('excel_blob_url')}")
+                    print(f"   - Excel Blob Path: {blob_info.get('excel_blob_path')}")
+                else:
+                    print("❌ Failed to retrieve blob info")
+
                 # Verify the data matches
-                if (retrieved_record.excel_blob_url == test_record.excel_blob_url and 
-                    retrieved_record.excel_blob_path == test_record.excel_blob_path):
+                if (retrieved_record.excel_blob_url == test_record.excel_blob_url and
+                    retrieved_record.excel_blob_path == test_record.excel_blob_path and
+                    blob_info and
+                    blob_info.get('excel_blob_url') == test_record.excel_blob_url and
+                    blob_info.get('excel_blob_path') == test_record.excel_blob_path):
                     print("🎉 SUCCESS: Excel blob fields are being saved and retrieved correctly!")
                 else:
                     print("❌ FAILURE: Excel blob fields don't match!")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit test for the DB-row hydration path: a record round-tripped through
+_prepare_record_for_db and _extract_record_from_db must come back
+field-for-field equal, so schema drift between OnePagerRecord and the
+hydration pipeline (key filtering, msgspec check, model_construct) is
+caught without a live database.
+"""
+
+import os
+import sys
+
+# Dummy credentials: client creation is lazy, so no connection is made
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test-key")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
+
+from services.database_service import DatabaseService, OnePagerRecord
+
+FULL_RECORD = OnePagerRecord(
+    request_id="test_hydration_1",
+    session_id="session-1",
+    company_name="Test Company",
+    website_url="https://testcompany.com",
+    status="success",
+    generated_at="2026-08-30T00:00:00+00:00",
+    duration_ms=15000,
+    folder_title="test_folder",
+    base_path="one-pagers/test",
+    container="bynd-dev",
+    pptx_filename="test.pptx",
+    pptx_blob_url="https://example.com/test.pptx",
+    pptx_blob_path="one-pagers/test/test.pptx",
+    metadata_blob_url="https://example.com/test_metadata.json",
+    excel_provided=True,
+    excel_filename="test_data.xlsx",
+    excel_size=50000,
+    excel_blob_url="https://example.com/test_data.xlsx",
+    excel_blob_path="one-pagers/test/excel/test_data.xlsx",
+    sections_status={"about": {"ok": True}},
+    sections_response={"about": "Test response"},
+    section_sources={"about": ["https://testcompany.com/about"]},
+    product_images=["https://example.com/product1.jpg"],
+    products=[{"name": "Test Product", "price": "$99"}],
+    company_logo="https://example.com/logo.png",
+    azure_upload_ok=True,
+    warnings=["Test warning"],
+)
+
+
+def test_round_trip_field_equality():
+    """Every model field survives prepare -> extract unchanged"""
+    db_service = DatabaseService()
+
+    db_row = db_service._prepare_record_for_db(FULL_RECORD)
+    # Simulate what Supabase adds to the stored row
+    db_row['id'] = 42
+    db_row['created_at'] = "2026-08-30T00:00:01+00:00"
+    db_row['updated_at'] = "2026-08-30T00:00:02+00:00"
+
+    hydrated = db_service._extract_record_from_db(db_row)
+
+    for field in OnePagerRecord.model_fields:
+        if field in ('id', 'created_at', 'updated_at', 'excel_blob_info'):
+            continue
+        assert getattr(hydrated, field) == getattr(FULL_RECORD, field), \
+            f"Field mismatch after round trip: {field}"
+
+    assert hydrated.id == 42
+    assert hydrated.created_at == "2026-08-30T00:00:01+00:00"
+    assert hydrated.updated_at == "2026-08-30T00:00:02+00:00"
+
+
+def test_extra_columns_are_ignored():
+    """Unknown columns returned by Supabase must not leak into the model"""
+    db_service = DatabaseService()
+
+    db_row = db_service._prepare_record_for_db(FULL_RECORD)
+    db_row['id'] = 1
+    db_row['some_future_column'] = "surprise"
+
+    hydrated = db_service._extract_record_from_db(db_row)
+    assert not hasattr(hydrated, 'some_future_column')
+    assert hydrated.request_id == FULL_RECORD.request_id
+
+
+def test_summary_row_fills_defaults():
+    """Rows from the lean list SELECT hydrate with defaults for omitted fields"""
+    db_service = DatabaseService()
+
+    db_row = db_service._prepare_record_for_db(FULL_RECORD)
+    db_row['id'] = 1
+    for heavy in ('sections_status', 'sections_response', 'section_sources',
+                  'product_images', 'products'):
+        db_row.pop(heavy)
+
+    hydrated = db_service._extract_record_from_db(db_row)
+    assert hydrated.sections_status is None
+    assert hydrated.products is None
+    assert hydrated.company_name == FULL_RECORD.company_name
+
+
+if __name__ == "__main__":
+    print("🧪 Testing record hydration round trip...")
+    test_round_trip_field_equality()
+    print("✅ Round-trip field equality")
+    test_extra_columns_are_ignored()
+    print("✅ Extra columns ignored")
+    test_summary_row_fills_defaults()
+    print("✅ Summary rows fill defaults")
+    print("🏁 All hydration tests passed!")